@@ -1,10 +1,9 @@
-import os
 import logging
-import json
-from typing import Dict, Any, List, Optional, Protocol
+from typing import Callable, Dict, Any, List, Optional, Protocol
+from functools import lru_cache
 
-from app.agent.intent_analyzer import IntentAnalyzer, get_intent_analyzer
-from app.devin_integration.devin_api import DevinAPI, get_devin_api
+from app.agent.intent_analyzer import get_intent_analyzer
+from app.devin_integration.devin_api import get_devin_api
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +45,14 @@ class AgentManager:
         self.tool_executor = tool_executor or get_devin_api()
         self.max_context_length = max_context_length
         
+        # Dispatch table for intent types; unknown types fall back to the general handler
+        self._intent_handlers: Dict[str, Callable[[Dict[str, Any], List[Dict[str, Any]]], str]] = {
+            "question": self._handle_question_intent,
+            "request": self._handle_request_intent,
+            "greeting": self._handle_greeting_intent,
+            "farewell": self._handle_farewell_intent
+        }
+        
         logger.info("Agent manager initialized")
     
     def process_message(self, message: str, user_id: str, conversation_state: Dict[str, Any]) -> Dict[str, Any]:
@@ -78,7 +85,7 @@ class AgentManager:
                 "conversation_state": updated_state
             }
         except Exception as e:
-            logger.error(f"Error processing message: {e}")
+            logger.error("Error processing message: %s", e)
             return {
                 "message": "Sorry, I encountered an error while processing your message.",
                 "conversation_state": conversation_state
@@ -96,13 +103,12 @@ class AgentManager:
         Returns:
             List[Dict[str, Any]]: Updated conversation context
         """
-        updated_context = context.copy()
+        # Slice to the window first so only the retained messages are copied
+        keep = self.max_context_length - 1
+        updated_context = context[-keep:] if keep > 0 else []
         
         updated_context.append({"role": role, "content": message})
         
-        if len(updated_context) > self.max_context_length:
-            updated_context = updated_context[-self.max_context_length:]
-        
         return updated_context
     
     def _create_updated_state(self, user_id: str, context: List[Dict[str, Any]], intent: Dict[str, Any]) -> Dict[str, Any]:
@@ -140,20 +146,10 @@ class AgentManager:
             if intent.get("requires_devin_api", False):
                 return self._handle_tool_intent(intent, context)
             
-            intent_type = intent.get("type", "general")
-            
-            if intent_type == "question":
-                return self._handle_question_intent(intent, context)
-            elif intent_type == "request":
-                return self._handle_request_intent(intent, context)
-            elif intent_type == "greeting":
-                return "Hello! How can I assist you today?"
-            elif intent_type == "farewell":
-                return "Goodbye! Feel free to message me anytime you need assistance."
-            else:
-                return "I'm here to help. What would you like to know or do?"
+            handler = self._intent_handlers.get(intent.get("type", "general"), self._handle_general_intent)
+            return handler(intent, context)
         except Exception as e:
-            logger.error(f"Error generating response: {e}")
+            logger.error("Error generating response: %s", e)
             return "I'm sorry, I couldn't generate a proper response. Please try again."
     
     def _handle_tool_intent(self, intent: Dict[str, Any], context: List[Dict[str, Any]]) -> str:
@@ -175,7 +171,7 @@ class AgentManager:
             )
             return response.get("content", "I couldn't complete the operation.")
         except Exception as e:
-            logger.error(f"Error executing tool: {e}")
+            logger.error("Error executing tool: %s", e)
             return "I encountered an error while trying to use the required tools."
     
     def _handle_question_intent(self, intent: Dict[str, Any], context: List[Dict[str, Any]]) -> str:
@@ -203,12 +199,54 @@ class AgentManager:
             str: Response to the request
         """
         return "I'll help you with that request..."
+    
+    def _handle_greeting_intent(self, intent: Dict[str, Any], context: List[Dict[str, Any]]) -> str:
+        """
+        Handle greeting intent.
+        
+        Args:
+            intent: Analyzed intent
+            context: Conversation context
+            
+        Returns:
+            str: Response to the greeting
+        """
+        return "Hello! How can I assist you today?"
+    
+    def _handle_farewell_intent(self, intent: Dict[str, Any], context: List[Dict[str, Any]]) -> str:
+        """
+        Handle farewell intent.
+        
+        Args:
+            intent: Analyzed intent
+            context: Conversation context
+            
+        Returns:
+            str: Response to the farewell
+        """
+        return "Goodbye! Feel free to message me anytime you need assistance."
+    
+    def _handle_general_intent(self, intent: Dict[str, Any], context: List[Dict[str, Any]]) -> str:
+        """
+        Handle general or unrecognized intent.
+        
+        Args:
+            intent: Analyzed intent
+            context: Conversation context
+            
+        Returns:
+            str: Generic assistance response
+        """
+        return "I'm here to help. What would you like to know or do?"
 
+@lru_cache(maxsize=None)
 def get_agent_manager() -> AgentManager:
     """
-    Get an agent manager instance.
+    Get the shared agent manager instance.
+    
+    Created on first use and shared by the LINE and Telegram bots.
     
     Returns:
-        AgentManager: An agent manager instance
+        AgentManager: The shared agent manager instance
     """
     return AgentManager()
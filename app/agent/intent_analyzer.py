@@ -1,11 +1,54 @@
-import os
 import logging
-import json
-from typing import Dict, Any, List, Optional, Set
+from typing import Dict, Any, List, Optional, Tuple
 import re
+import unicodedata
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
+# Default patterns and keywords, built once at import and shared by all analyzers
+DEFAULT_QUESTION_PATTERNS = (
+    r'^what\s.+\?$',
+    r'^how\s.+\?$',
+    r'^why\s.+\?$',
+    r'^when\s.+\?$',
+    r'^where\s.+\?$',
+    r'^who\s.+\?$',
+    r'^can\s.+\?$',
+    r'.+\?$'
+)
+
+DEFAULT_REQUEST_PATTERNS = (
+    r'^please\s.+',
+    r'^could you\s.+',
+    r'^can you\s.+',
+    r'^would you\s.+',
+    r'^I need\s.+',
+    r'^I want\s.+'
+)
+
+DEFAULT_GREETING_PATTERNS = (
+    r'^hi$',
+    r'^hello$',
+    r'^hey$',
+    r'^good morning$',
+    r'^good afternoon$',
+    r'^good evening$'
+)
+
+DEFAULT_FAREWELL_PATTERNS = (
+    r'^bye$',
+    r'^goodbye$',
+    r'^see you$',
+    r'^talk to you later$',
+    r'^farewell$'
+)
+
+DEFAULT_DEVIN_KEYWORDS = frozenset({
+    "code", "programming", "develop", "build", "create", "generate",
+    "analyze", "debug", "fix", "implement", "deploy", "automate"
+})
+
 class IntentAnalyzer:
     """
     Intent analyzer for determining user intent from messages.
@@ -21,7 +64,8 @@ class IntentAnalyzer:
         request_patterns: Optional[List[str]] = None,
         greeting_patterns: Optional[List[str]] = None,
         farewell_patterns: Optional[List[str]] = None,
-        devin_keywords: Optional[List[str]] = None
+        devin_keywords: Optional[List[str]] = None,
+        cache_size: int = 128
     ):
         """
         Initialize the intent analyzer.
@@ -32,49 +76,16 @@ class IntentAnalyzer:
             greeting_patterns: Regex patterns for identifying greeting intents
             farewell_patterns: Regex patterns for identifying farewell intents
             devin_keywords: Keywords that indicate a need for Devin API
+            cache_size: Maximum number of classified messages to keep in the LRU cache
         """
         # Initialize intent patterns with defaults if not provided
-        self.question_patterns = question_patterns or [
-            r'^what\s.+\?$',
-            r'^how\s.+\?$',
-            r'^why\s.+\?$',
-            r'^when\s.+\?$',
-            r'^where\s.+\?$',
-            r'^who\s.+\?$',
-            r'^can\s.+\?$',
-            r'.+\?$'
-        ]
+        self.question_patterns = question_patterns or DEFAULT_QUESTION_PATTERNS
+        self.request_patterns = request_patterns or DEFAULT_REQUEST_PATTERNS
+        self.greeting_patterns = greeting_patterns or DEFAULT_GREETING_PATTERNS
+        self.farewell_patterns = farewell_patterns or DEFAULT_FAREWELL_PATTERNS
+        self.devin_keywords = devin_keywords or DEFAULT_DEVIN_KEYWORDS
         
-        self.request_patterns = request_patterns or [
-            r'^please\s.+',
-            r'^could you\s.+',
-            r'^can you\s.+',
-            r'^would you\s.+',
-            r'^I need\s.+',
-            r'^I want\s.+'
-        ]
-        
-        self.greeting_patterns = greeting_patterns or [
-            r'^hi$',
-            r'^hello$',
-            r'^hey$',
-            r'^good morning$',
-            r'^good afternoon$',
-            r'^good evening$'
-        ]
-        
-        self.farewell_patterns = farewell_patterns or [
-            r'^bye$',
-            r'^goodbye$',
-            r'^see you$',
-            r'^talk to you later$',
-            r'^farewell$'
-        ]
-        
-        self.devin_keywords = devin_keywords or [
-            "code", "programming", "develop", "build", "create", "generate",
-            "analyze", "debug", "fix", "implement", "deploy", "automate"
-        ]
+        self.cache_size = cache_size
         
         self._compile_patterns()
         
@@ -84,12 +95,21 @@ class IntentAnalyzer:
         """
         Compile regex patterns for better performance.
         """
-        self.compiled_question_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in self.question_patterns]
-        self.compiled_request_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in self.request_patterns]
-        self.compiled_greeting_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in self.greeting_patterns]
-        self.compiled_farewell_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in self.farewell_patterns]
+        # Compiled patterns per intent type, checked in priority order
+        self.compiled_intent_patterns = [
+            ("question", [re.compile(pattern, re.IGNORECASE) for pattern in self.question_patterns]),
+            ("request", [re.compile(pattern, re.IGNORECASE) for pattern in self.request_patterns]),
+            ("greeting", [re.compile(pattern, re.IGNORECASE) for pattern in self.greeting_patterns]),
+            ("farewell", [re.compile(pattern, re.IGNORECASE) for pattern in self.farewell_patterns])
+        ]
         
-        self.devin_keywords_set = set(self.devin_keywords)
+        # Single alternation so keyword detection is one scan over the message
+        self.compiled_devin_keywords_pattern = re.compile(
+            "|".join(re.escape(keyword.lower()) for keyword in sorted(self.devin_keywords))
+        )
+        
+        # Recreated on every compile so cached results never outlive the patterns
+        self._classify_cached = lru_cache(maxsize=self.cache_size)(self._classify)
     
     def analyze(self, message: str, context: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -103,20 +123,14 @@ class IntentAnalyzer:
             Dict[str, Any]: Analyzed intent
         """
         try:
-            message_lower = message.lower()
-            
-            # Determine intent type
-            intent_type = self._determine_intent_type(message_lower)
+            normalized_message = self._normalize_message(message)
             
-            # Determine if Devin API is required
-            requires_devin_api = self._requires_devin_api(message_lower)
+            # Determine intent type and tool requirements (cached per normalized message)
+            intent_type, requires_devin_api, tool_name = self._classify_cached(normalized_message)
             
             # Extract parameters if needed
             parameters = self._extract_parameters(message) if requires_devin_api else {}
             
-            # Determine tool name if Devin API is required
-            tool_name = self._determine_tool_name(message_lower) if requires_devin_api else None
-            
             intent = {
                 "type": intent_type,
                 "requires_devin_api": requires_devin_api,
@@ -125,12 +139,45 @@ class IntentAnalyzer:
                 "raw_message": message
             }
             
-            logger.debug(f"Analyzed intent: {intent}")
+            logger.debug("Analyzed intent: %s", intent)
             return intent
         except Exception as e:
-            logger.error(f"Error analyzing intent: {e}")
+            logger.error("Error analyzing intent: %s", e)
             return {"type": "general", "requires_devin_api": False, "raw_message": message}
     
+    def _normalize_message(self, message: str) -> str:
+        """
+        Normalize a message so equivalent inputs share a cache entry.
+        
+        Applies NFKC normalization (e.g. full-width to half-width characters),
+        collapses whitespace and lowercases the result.
+        
+        Args:
+            message: User message
+            
+        Returns:
+            str: Normalized message
+        """
+        return " ".join(unicodedata.normalize("NFKC", message).split()).lower()
+    
+    def _classify(self, message: str) -> Tuple[str, bool, Optional[str]]:
+        """
+        Classify a message by intent type and tool requirements.
+        
+        Args:
+            message: Normalized user message
+            
+        Returns:
+            Tuple[str, bool, Optional[str]]: Intent type, whether Devin API is required, and tool name
+        """
+        intent_type = self._determine_intent_type(message)
+        
+        requires_devin_api = self._requires_devin_api(message)
+        
+        tool_name = self._determine_tool_name(message) if requires_devin_api else None
+        
+        return intent_type, requires_devin_api, tool_name
+    
     def _determine_intent_type(self, message: str) -> str:
         """
         Determine the type of intent from the message.
@@ -141,21 +188,9 @@ class IntentAnalyzer:
         Returns:
             str: Intent type
         """
-        for pattern in self.compiled_question_patterns:
-            if pattern.search(message):
-                return "question"
-        
-        for pattern in self.compiled_request_patterns:
-            if pattern.search(message):
-                return "request"
-        
-        for pattern in self.compiled_greeting_patterns:
-            if pattern.search(message):
-                return "greeting"
-        
-        for pattern in self.compiled_farewell_patterns:
-            if pattern.search(message):
-                return "farewell"
+        for intent_type, patterns in self.compiled_intent_patterns:
+            if any(pattern.search(message) for pattern in patterns):
+                return intent_type
         
         return "general"
     
@@ -169,11 +204,7 @@ class IntentAnalyzer:
         Returns:
             bool: True if Devin API is required, False otherwise
         """
-        for keyword in self.devin_keywords:
-            if keyword in message:
-                return True
-        
-        return False
+        return self.compiled_devin_keywords_pattern.search(message) is not None
     
     def _determine_tool_name(self, message: str) -> str:
         """
@@ -207,11 +238,14 @@ class IntentAnalyzer:
         """
         return {"query": message}
 
+@lru_cache(maxsize=None)
 def get_intent_analyzer() -> IntentAnalyzer:
     """
-    Get an intent analyzer instance.
+    Get the shared intent analyzer instance.
+    
+    Shared so every caller benefits from the classification cache.
     
     Returns:
-        IntentAnalyzer: An intent analyzer instance
+        IntentAnalyzer: The shared intent analyzer instance
     """
     return IntentAnalyzer()
@@ -1,8 +1,8 @@
 import os
 import logging
-from typing import List, Dict, Any, Optional
+from typing import Dict, Any
+from functools import lru_cache
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 class SupabaseClient:
@@ -22,7 +22,7 @@ class SupabaseClient:
                 self.supabase = create_client(self.supabase_url, self.supabase_key)
                 logger.info("Supabase client initialized")
             except Exception as e:
-                logger.error(f"Error initializing Supabase client: {e}")
+                logger.error("Error initializing Supabase client: %s", e)
                 self.supabase = None
     
     def create_tables(self) -> bool:
@@ -40,7 +40,7 @@ class SupabaseClient:
             logger.info("Tables created successfully")
             return True
         except Exception as e:
-            logger.error(f"Error creating tables: {e}")
+            logger.error("Error creating tables: %s", e)
             return False
     
     def store_conversation_state(self, user_id: str, conversation_data: Dict[str, Any]) -> bool:
@@ -67,10 +67,10 @@ class SupabaseClient:
                 conversation_data["user_id"] = user_id
                 self.supabase.table("conversations").insert(conversation_data).execute()
             
-            logger.info(f"Stored conversation state for user {user_id}")
+            logger.info("Stored conversation state for user %s", user_id)
             return True
         except Exception as e:
-            logger.error(f"Error storing conversation state: {e}")
+            logger.error("Error storing conversation state: %s", e)
             return False
     
     def get_conversation_state(self, user_id: str) -> Dict[str, Any]:
@@ -91,12 +91,12 @@ class SupabaseClient:
             response = self.supabase.table("conversations").select("*").eq("user_id", user_id).execute()
             
             if response.data:
-                logger.info(f"Retrieved conversation state for user {user_id}")
+                logger.info("Retrieved conversation state for user %s", user_id)
                 return response.data[0]
             else:
                 return {"user_id": user_id, "context": [], "intent": None}
         except Exception as e:
-            logger.error(f"Error getting conversation state: {e}")
+            logger.error("Error getting conversation state: %s", e)
             return {"user_id": user_id, "context": [], "intent": None}
     
     def store_user_feedback(self, user_id: str, message_id: str, feedback: Dict[str, Any]) -> bool:
@@ -123,18 +123,21 @@ class SupabaseClient:
             }
             self.supabase.table("feedback").insert(feedback_data).execute()
             
-            logger.info(f"Stored feedback for message {message_id}")
+            logger.info("Stored feedback for message %s", message_id)
             return True
         except Exception as e:
-            logger.error(f"Error storing feedback: {e}")
+            logger.error("Error storing feedback: %s", e)
             return False
 
+@lru_cache(maxsize=None)
 def get_supabase_client() -> SupabaseClient:
     """
-    Get a Supabase client instance.
+    Get the shared Supabase client instance.
+    
+    Created on first use so every bot shares one database connection.
     
     Returns:
-        SupabaseClient: A Supabase client instance
+        SupabaseClient: The shared Supabase client instance
     """
     supabase_client = SupabaseClient()
     supabase_client.create_tables()
@@ -1,11 +1,21 @@
 import os
 import logging
-import json
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+from functools import lru_cache
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from orjson import dumps as json_dumps, loads as json_loads
+except ImportError:
+    from json import dumps as json_dumps, loads as json_loads
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on how much of an error response body is written to the log
+MAX_LOGGED_RESPONSE_CHARS = 1024
+
 class DevinAPI:
     """
     Devin API client for executing tool calls.
@@ -14,22 +24,55 @@ class DevinAPI:
     allowing for execution of tool calls with parameters and context.
     """
     
-    def __init__(self, api_key: Optional[str] = None, api_url: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        api_url: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+        timeout: Tuple[float, float] = (5, 30)
+    ):
         """
         Initialize the Devin API client.
         
         Args:
             api_key: Devin API key for authentication
             api_url: Devin API URL
+            session: HTTP session to reuse; a new one is created if not provided
+            timeout: Connect and read timeouts in seconds for API requests
         """
         self.api_key = api_key or os.getenv("DEVIN_API_KEY")
         self.api_url = api_url or os.getenv("DEVIN_API_URL", "https://api.devin.com/v1")
         
+        self.timeout = timeout
+        
+        # Reuse one session so repeated tool calls keep the connection alive
+        self.session = session or self._create_session()
+        
         if not self.api_key:
             logger.warning("Devin API key not set. API calls will not work.")
         
         logger.info("Devin API client initialized")
     
+    def _create_session(self) -> requests.Session:
+        """
+        Create an HTTP session with connection pooling and retries.
+        
+        Returns:
+            requests.Session: Configured session
+        """
+        # POST is not in Retry's default allowed methods, so only failures before
+        # the request is sent are retried and tool calls are never executed twice
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(total=2, backoff_factor=0.3)
+        )
+        
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+    
     def execute_tool(self, tool_name: str, parameters: Dict[str, Any], context: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Execute a tool call through the Devin API.
@@ -53,7 +96,7 @@ class DevinAPI:
             
             return self._process_response(response)
         except Exception as e:
-            logger.error(f"Error calling Devin API: {e}")
+            logger.error("Error calling Devin API: %s", e)
             return self._create_error_response("An error occurred while trying to use the tool.")
     
     def _prepare_payload(self, tool_name: str, parameters: Dict[str, Any], context: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -84,13 +127,14 @@ class DevinAPI:
         Returns:
             requests.Response: API response
         """
-        return requests.post(
+        return self.session.post(
             f"{self.api_url}/tools/execute",
             headers={
                 "Authorization": f"Bearer {self.api_key}",
                 "Content-Type": "application/json"
             },
-            json=payload
+            data=json_dumps(payload),
+            timeout=self.timeout
         )
     
     def _process_response(self, response: requests.Response) -> Dict[str, Any]:
@@ -104,9 +148,13 @@ class DevinAPI:
             Dict[str, Any]: Processed response
         """
         if response.status_code == 200:
-            return response.json()
+            return json_loads(response.content)
         else:
-            logger.error(f"Error executing tool: {response.status_code} - {response.text}")
+            logger.error(
+                "Error executing tool: %s - %s",
+                response.status_code,
+                response.text[:MAX_LOGGED_RESPONSE_CHARS]
+            )
             return self._create_error_response(f"Error executing tool: {response.status_code}")
     
     def _create_error_response(self, message: str) -> Dict[str, Any]:
@@ -121,11 +169,14 @@ class DevinAPI:
         """
         return {"content": message}
 
+@lru_cache(maxsize=None)
 def get_devin_api() -> DevinAPI:
     """
-    Get a Devin API client instance.
+    Get the shared Devin API client instance.
+    
+    Reusing one client lets all callers share its connection pool.
     
     Returns:
-        DevinAPI: A Devin API client instance
+        DevinAPI: The shared Devin API client instance
     """
     return DevinAPI()
@@ -1,17 +1,17 @@
 import os
 import logging
-from typing import Dict, Any, List, Optional, Protocol
+from typing import Dict, Any, Optional, Protocol
 from linebot.v3.webhook import WebhookHandler
 from linebot.v3.messaging import MessagingApi, Configuration, ApiClient
 from linebot.v3.webhooks.models import MessageEvent, Event
 from linebot.v3.webhooks.models.text_message_content import TextMessageContent
-from linebot.exceptions import InvalidSignatureError, LineBotApiError
+from linebot.exceptions import InvalidSignatureError
 from linebot.v3.messaging.models import (
     TextMessage, ReplyMessageRequest
 )
 
-from app.agent.agent_manager import get_agent_manager, AgentManager
-from app.database.supabase_client import get_supabase_client, SupabaseClient
+from app.agent.agent_manager import get_agent_manager
+from app.database.supabase_client import get_supabase_client
 
 logger = logging.getLogger(__name__)
 
@@ -89,13 +89,13 @@ class LineBot:
         @self.handler.add(MessageEvent, message=TextMessageContent)
         def handle_message(event: Event) -> None:
             """Handle message events."""
-            logger.info(f"Handling message event: {event}")
+            logger.debug("Handling message event: %s", event)
             self._handle_text_message(event)
         
         @self.handler.default()
         def default(event: Event) -> None:
             """Handle default events."""
-            logger.info(f"Received default event: {event}")
+            logger.debug("Received default event: %s", event)
         
         logger.info("LINE bot handlers registered")
     
@@ -114,8 +114,8 @@ class LineBot:
             logger.warning("LINE handler not initialized. Skipping webhook handling.")
             return False
         
-        logger.debug(f"Handling webhook with signature: {signature}")
-        logger.debug(f"Webhook body: {body}")
+        logger.debug("Handling webhook with signature: %s", signature)
+        logger.debug("Webhook body: %s", body)
         
         try:
             self.handler.handle(body, signature)
@@ -125,7 +125,7 @@ class LineBot:
             logger.error("Invalid signature")
             return False
         except Exception as e:
-            logger.error(f"Error handling webhook: {e}")
+            logger.error("Error handling webhook: %s", e)
             return False
     
     def _handle_text_message(self, event: MessageEvent) -> None:
@@ -151,9 +151,9 @@ class LineBot:
             
             self._send_response(event.reply_token, response.get("message", ""))
             
-            logger.info(f"Handled text message from user {user_id}")
+            logger.info("Handled text message from user %s", user_id)
         except Exception as e:
-            logger.error(f"Error handling text message: {e}")
+            logger.error("Error handling text message: %s", e)
             self._send_error_response(event.reply_token)
     
     def _get_user_id_from_event(self, event: MessageEvent) -> str:
@@ -184,7 +184,7 @@ class LineBot:
                 )
             )
         except Exception as e:
-            logger.error(f"Error sending response: {e}")
+            logger.error("Error sending response: %s", e)
     
     def _send_error_response(self, reply_token: str) -> None:
         """
@@ -201,7 +201,7 @@ class LineBot:
                 )
             )
         except Exception as e:
-            logger.error(f"Error sending error response: {e}")
+            logger.error("Error sending error response: %s", e)
 
 def get_line_bot() -> LineBot:
     """
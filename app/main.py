@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import os
 from dotenv import load_dotenv
@@ -6,8 +7,6 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
 from app.telegram_bot.telegram_bot import get_telegram_bot
-from app.database.supabase_client import get_supabase_client
-from app.agent.agent_manager import get_agent_manager
 
 load_dotenv()
 
@@ -26,8 +25,6 @@ app.add_middleware(
 
 telegram_bot = get_telegram_bot()
 
-agent_manager = get_agent_manager()
-
 @app.get("/healthz")
 async def healthz():
     return {"status": "ok"}
@@ -44,7 +41,7 @@ async def webhook(token: str, request: Request):
     
     body = await request.body()
     
-    logger.info(f"Received webhook request")
+    logger.info("Received webhook request")
     
     try:
         if await telegram_bot.handle_webhook(body):
@@ -53,13 +50,17 @@ async def webhook(token: str, request: Request):
             logger.warning("Webhook handling failed")
             raise HTTPException(status_code=400, detail="Invalid request")
     except Exception as e:
-        logger.error(f"Error handling webhook: {e}")
+        logger.error("Error handling webhook: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @app.on_event("startup")
 async def startup_event():
     """
     Set up webhook on startup.
+    
+    The Telegram API round trip runs as a background task so the server
+    starts accepting requests without waiting for it.
     """
     if os.getenv("TELEGRAM_BOT_TOKEN") and os.getenv("TELEGRAM_WEBHOOK_URL"):
-        await telegram_bot.setup_webhook()
+        # Keep a reference so the task is not garbage collected before it finishes
+        app.state.webhook_task = asyncio.create_task(telegram_bot.setup_webhook())
@@ -1,16 +1,25 @@
 import os
+import asyncio
 import logging
-import json
-from typing import Dict, Any, List, Optional, Protocol
+import weakref
+from typing import Dict, Any, Optional, Protocol
 from telegram import Update
-from telegram.ext import Application, CommandHandler, MessageHandler as TelegramMessageHandler, filters, ContextTypes, CallbackContext
-from telegram.ext.filters import MessageFilter
+from telegram.ext import Application, CommandHandler, MessageHandler as TelegramMessageHandler, filters, ContextTypes
 
-from app.agent.agent_manager import get_agent_manager, AgentManager
-from app.database.supabase_client import get_supabase_client, SupabaseClient
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+from app.agent.agent_manager import get_agent_manager
+from app.database.supabase_client import get_supabase_client
 
 logger = logging.getLogger(__name__)
 
+START_MESSAGE = "こんにちは！何かお手伝いできることはありますか？"
+HELP_MESSAGE = "このボットはあなたの質問や要望に応答します。メッセージを送信してみてください。"
+ERROR_MESSAGE = "申し訳ありません、エラーが発生しました。"
+
 class MessageHandlerProtocol(Protocol):
     """Protocol for message handling components."""
     def process_message(self, message: str, user_id: str, conversation_state: Dict[str, Any]) -> Dict[str, Any]:
@@ -40,7 +49,8 @@ class TelegramBot:
         token: Optional[str] = None,
         webhook_url: Optional[str] = None,
         message_handler: Optional[MessageHandlerProtocol] = None,
-        database_client: Optional[DatabaseClient] = None
+        database_client: Optional[DatabaseClient] = None,
+        max_concurrent_messages: int = 32
     ):
         """
         Initialize the Telegram bot.
@@ -50,6 +60,7 @@ class TelegramBot:
             webhook_url: Webhook URL for Telegram
             message_handler: Component for processing messages
             database_client: Component for database operations
+            max_concurrent_messages: Maximum number of messages processed at the same time
         """
         self.token = token or os.getenv("TELEGRAM_BOT_TOKEN")
         self.webhook_url = webhook_url or os.getenv("TELEGRAM_WEBHOOK_URL")
@@ -60,6 +71,12 @@ class TelegramBot:
         # Initialize message handler and database client
         self.message_handler = message_handler or get_agent_manager()
         self.database_client = database_client or get_supabase_client()
+        
+        # Bound in-flight message processing so bursts cannot pile up worker threads
+        self._message_semaphore = asyncio.Semaphore(max_concurrent_messages)
+        
+        # Per-user locks serialize each user's state updates; unused locks are dropped automatically
+        self._user_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
     
     def _initialize_telegram_app(self) -> None:
         """Initialize Telegram application and handlers."""
@@ -67,7 +84,9 @@ class TelegramBot:
             logger.warning("Telegram bot token not set. Telegram bot will not work properly.")
             self.application = None
         else:
-            self.application = Application.builder().token(self.token).build()
+            # Updates arrive through handle_webhook, so no polling Updater (and its
+            # separate getUpdates connection pool) is needed
+            self.application = Application.builder().token(self.token).updater(None).build()
             
             self._setup_handlers()
             
@@ -90,11 +109,11 @@ class TelegramBot:
     
     async def _handle_start(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle /start command."""
-        await update.message.reply_text("こんにちは！何かお手伝いできることはありますか？")
+        await update.message.reply_text(START_MESSAGE)
     
     async def _handle_help(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle /help command."""
-        await update.message.reply_text("このボットはあなたの質問や要望に応答します。メッセージを送信してみてください。")
+        await update.message.reply_text(HELP_MESSAGE)
     
     async def _handle_message(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle text messages."""
@@ -105,18 +124,51 @@ class TelegramBot:
             message_text = update.message.text
             user_id = str(update.effective_user.id)
             
-            conversation_state = self.database_client.get_conversation_state(user_id)
-            
-            response = self.message_handler.process_message(message_text, user_id, conversation_state)
-            
-            self.database_client.store_conversation_state(user_id, response.get("conversation_state", {}))
+            async with self._get_user_lock(user_id), self._message_semaphore:
+                # Agent and database calls are blocking, so keep them off the event loop
+                response = await asyncio.to_thread(self._process_text_message, message_text, user_id)
             
             await update.message.reply_text(response.get("message", ""))
             
-            logger.info(f"Handled text message from user {user_id}")
+            logger.info("Handled text message from user %s", user_id)
         except Exception as e:
-            logger.error(f"Error handling text message: {e}")
-            await update.message.reply_text("申し訳ありません、エラーが発生しました。")
+            logger.error("Error handling text message: %s", e)
+            await update.message.reply_text(ERROR_MESSAGE)
+    
+    def _get_user_lock(self, user_id: str) -> asyncio.Lock:
+        """
+        Get the lock guarding a user's conversation state.
+        
+        Args:
+            user_id: Telegram user ID
+            
+        Returns:
+            asyncio.Lock: Lock shared by all in-flight messages from the user
+        """
+        lock = self._user_locks.get(user_id)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._user_locks[user_id] = lock
+        return lock
+    
+    def _process_text_message(self, message_text: str, user_id: str) -> Dict[str, Any]:
+        """
+        Process a text message and persist the updated conversation state.
+        
+        Args:
+            message_text: Text of the incoming message
+            user_id: Telegram user ID
+            
+        Returns:
+            Dict[str, Any]: Response data from the message handler
+        """
+        conversation_state = self.database_client.get_conversation_state(user_id)
+        
+        response = self.message_handler.process_message(message_text, user_id, conversation_state)
+        
+        self.database_client.store_conversation_state(user_id, response.get("conversation_state", {}))
+        
+        return response
     
     async def setup_webhook(self) -> bool:
         """
@@ -134,10 +186,10 @@ class TelegramBot:
             webhook_url = f"{self.webhook_url.rstrip('/')}{webhook_path}"
             
             await self.application.bot.set_webhook(url=webhook_url)
-            logger.info(f"Webhook set up at {webhook_url}")
+            logger.info("Webhook set up at %s", webhook_url)
             return True
         except Exception as e:
-            logger.error(f"Error setting up webhook: {e}")
+            logger.error("Error setting up webhook: %s", e)
             return False
     
     async def handle_webhook(self, request_body: bytes) -> bool:
@@ -155,12 +207,12 @@ class TelegramBot:
             return False
         
         try:
-            update = Update.de_json(json.loads(request_body.decode("utf-8")), self.application.bot)
+            update = Update.de_json(json_loads(request_body), self.application.bot)
             await self.application.process_update(update)
             logger.info("Webhook handled successfully")
             return True
         except Exception as e:
-            logger.error(f"Error handling webhook: {e}")
+            logger.error("Error handling webhook: %s", e)
             return False
 
 def get_telegram_bot() -> TelegramBot:
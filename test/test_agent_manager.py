@@ -28,3 +28,20 @@ def test_process_message(agent_manager):
     assert "message" in result
     assert result["message"] == "It's sunny today!"
     assert "conversation_state" in result
+
+def test_generate_response_dispatches_on_intent_type(agent_manager):
+    greeting = agent_manager._generate_response("hi", "test_user", {"type": "greeting"}, [])
+    assert greeting == "Hello! How can I assist you today?"
+    
+    unknown = agent_manager._generate_response("???", "test_user", {"type": "unknown"}, [])
+    assert unknown == "I'm here to help. What would you like to know or do?"
+
+def test_update_context_keeps_recent_messages(agent_manager):
+    context = [{"role": "user", "content": str(i)} for i in range(agent_manager.max_context_length)]
+    
+    updated = agent_manager._update_context(context, "latest", "assistant")
+    
+    assert len(updated) == agent_manager.max_context_length
+    assert updated[0]["content"] == "1"
+    assert updated[-1] == {"role": "assistant", "content": "latest"}
+    assert len(context) == agent_manager.max_context_length
@@ -0,0 +1,27 @@
+import json
+import pytest
+from unittest.mock import MagicMock
+
+from app.devin_integration.devin_api import DevinAPI
+
+@pytest.fixture
+def devin_api():
+    return DevinAPI(api_key="test_key", api_url="https://test.com/v1", session=MagicMock())
+
+def test_execute_tool(devin_api):
+    devin_api.session.post.return_value = MagicMock(status_code=200, content=b'{"content": "Done"}')
+    
+    result = devin_api.execute_tool("code_assistant", {"query": "fix my code"}, [])
+    
+    assert result == {"content": "Done"}
+    devin_api.session.post.assert_called_once()
+    _, kwargs = devin_api.session.post.call_args
+    assert kwargs["timeout"] == devin_api.timeout
+    assert json.loads(kwargs["data"])["tool"] == "code_assistant"
+
+def test_execute_tool_error_status(devin_api):
+    devin_api.session.post.return_value = MagicMock(status_code=500, text="Internal error")
+    
+    result = devin_api.execute_tool("code_assistant", {"query": "fix my code"}, [])
+    
+    assert result == {"content": "Error executing tool: 500"}
@@ -0,0 +1,64 @@
+import pytest
+
+from app.agent.intent_analyzer import IntentAnalyzer
+
+@pytest.fixture
+def intent_analyzer():
+    return IntentAnalyzer()
+
+def test_requires_devin_api(intent_analyzer):
+    intent = intent_analyzer.analyze("Please debug this function", [])
+    assert intent["requires_devin_api"] is True
+    assert intent["tool_name"] == "code_debugger"
+    
+    intent = intent_analyzer.analyze("hello", [])
+    assert intent["requires_devin_api"] is False
+    assert intent["type"] == "greeting"
+
+def test_custom_keywords_are_escaped():
+    analyzer = IntentAnalyzer(devin_keywords=["c++", "Node.js"])
+    
+    assert analyzer.analyze("help me with c++", [])["requires_devin_api"] is True
+    assert analyzer.analyze("what is node.js?", [])["requires_devin_api"] is True
+    assert analyzer.analyze("what is nodexjs?", [])["requires_devin_api"] is False
+
+def test_classification_is_cached(intent_analyzer):
+    intent_analyzer.analyze("Can you fix my code?", [])
+    intent_analyzer.analyze("can you fix my code?", [])
+    
+    info = intent_analyzer._classify_cached.cache_info()
+    assert info.hits == 1
+    assert info.misses == 1
+
+@pytest.mark.parametrize("message, expected_type", [
+    ("What time is it?", "question"),
+    ("Could you send me the report", "request"),
+    ("Good morning", "greeting"),
+    ("See you", "farewell"),
+    ("The weather is nice", "general")
+])
+def test_determine_intent_type(intent_analyzer, message, expected_type):
+    assert intent_analyzer.analyze(message, [])["type"] == expected_type
+
+def test_messages_are_normalized(intent_analyzer):
+    assert intent_analyzer.analyze("これは何ですか？", [])["type"] == "question"
+    
+    intent = intent_analyzer.analyze("  Ｐｌｅａｓｅ   ｆｉｘ this ", [])
+    assert intent["type"] == "request"
+    assert intent["requires_devin_api"] is True
+    assert intent["raw_message"] == "  Ｐｌｅａｓｅ   ｆｉｘ this "
+    
+    intent_analyzer.analyze("please fix this", [])
+    assert intent_analyzer._classify_cached.cache_info().hits == 1
+
+def test_custom_patterns_with_backreferences():
+    analyzer = IntentAnalyzer(question_patterns=[r"^(a)\1$", r"^(b)\1$"])
+    
+    assert analyzer.analyze("bb", [])["type"] == "question"
+    assert analyzer.analyze("ab", [])["type"] == "general"
+
+def test_custom_patterns_with_inline_flags():
+    analyzer = IntentAnalyzer(question_patterns=[r"(?i)^what", r"^how"])
+    
+    assert analyzer.analyze("What now", [])["type"] == "question"
+    assert analyzer.analyze("how so", [])["type"] == "question"
@@ -1,7 +1,7 @@
 import os
 import pytest
 from unittest.mock import MagicMock, patch
-from linebot.v3.webhooks.models import MessageEvent, Source, UserSource
+from linebot.v3.webhooks.models import MessageEvent, UserSource
 from linebot.v3.webhooks.models.text_message_content import TextMessageContent
 
 from app.line_bot.line_bot import LineBot
@@ -14,7 +14,7 @@ def line_bot():
     }):
         return LineBot()
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def message_event():
     source = UserSource(user_id="test_user")
     return MessageEvent(
@@ -1,13 +1,27 @@
+import asyncio
 import os
+import time
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 import json
 from telegram import Update
 from telegram.ext import Application
 
 from app.telegram_bot.telegram_bot import TelegramBot
 
-@pytest.fixture
+# Canonical webhook body as it arrives from Telegram
+UPDATE_BYTES = (
+    b'{"update_id": 123456789, "message": {"message_id": 123, '
+    b'"from": {"id": 123456, "is_bot": false, "first_name": "Test", "username": "test_user"}, '
+    b'"chat": {"id": 123456, "first_name": "Test", "username": "test_user", "type": "private"}, '
+    b'"date": 1234567890, "text": "Hello, bot!"}}'
+)
+
+UPDATE_JSON = json.loads(UPDATE_BYTES)
+
+PAYLOADS = [json.dumps({**UPDATE_JSON, "update_id": i}).encode("utf-8") for i in range(1024)]
+
+@pytest.fixture(scope="module")
 def telegram_bot():
     with patch.dict(os.environ, {
         "TELEGRAM_BOT_TOKEN": "test_token",
@@ -15,41 +29,84 @@ def telegram_bot():
     }):
         return TelegramBot()
 
-@pytest.fixture
-def update_json():
-    return {
-        "update_id": 123456789,
-        "message": {
-            "message_id": 123,
-            "from": {
-                "id": 123456,
-                "is_bot": False,
-                "first_name": "Test",
-                "username": "test_user"
-            },
-            "chat": {
-                "id": 123456,
-                "first_name": "Test",
-                "username": "test_user",
-                "type": "private"
-            },
-            "date": 1234567890,
-            "text": "Hello, bot!"
-        }
-    }
-
 @pytest.mark.asyncio
-async def test_handle_webhook(telegram_bot, update_json):
+async def test_handle_webhook(telegram_bot):
     telegram_bot.application = MagicMock()
-    telegram_bot.application.process_update = MagicMock()
-    
-    update_bytes = json.dumps(update_json).encode("utf-8")
+    # Update.de_json reads tzinfo from bot.defaults; a mocked value is not a tzinfo
+    telegram_bot.application.bot.defaults = None
+    telegram_bot.application.process_update = AsyncMock()
     
-    result = await telegram_bot.handle_webhook(update_bytes)
+    result = await telegram_bot.handle_webhook(UPDATE_BYTES)
     assert result is True
-    telegram_bot.application.process_update.assert_called_once()
+    telegram_bot.application.process_update.assert_awaited_once()
     
     # Test with exception
     telegram_bot.application.process_update.side_effect = Exception("Test error")
-    result = await telegram_bot.handle_webhook(update_bytes)
+    result = await telegram_bot.handle_webhook(UPDATE_BYTES)
     assert result is False
+
+@pytest.mark.asyncio
+async def test_handle_webhook_batch(telegram_bot):
+    telegram_bot.application = MagicMock()
+    telegram_bot.application.bot.defaults = None
+    telegram_bot.application.process_update = AsyncMock()
+    
+    results = await asyncio.gather(*(telegram_bot.handle_webhook(payload) for payload in PAYLOADS))
+    
+    assert all(results)
+    assert telegram_bot.application.process_update.await_count == len(PAYLOADS)
+
+@pytest.mark.asyncio
+async def test_handle_message(telegram_bot):
+    telegram_bot.message_handler = MagicMock()
+    telegram_bot.message_handler.process_message.return_value = {
+        "message": "Hi there!",
+        "conversation_state": {"user_id": "123456", "context": []}
+    }
+    telegram_bot.database_client = MagicMock()
+    telegram_bot.database_client.get_conversation_state.return_value = {"user_id": "123456", "context": []}
+    
+    update = MagicMock()
+    update.message.text = "Hello, bot!"
+    update.message.reply_text = AsyncMock()
+    update.effective_user.id = 123456
+    
+    await telegram_bot._handle_message(update, MagicMock())
+    
+    telegram_bot.message_handler.process_message.assert_called_once_with(
+        "Hello, bot!", "123456", {"user_id": "123456", "context": []}
+    )
+    telegram_bot.database_client.store_conversation_state.assert_called_once()
+    update.message.reply_text.assert_awaited_once_with("Hi there!")
+
+@pytest.mark.asyncio
+async def test_handle_message_serializes_per_user(telegram_bot):
+    active = []
+    overlaps = []
+    
+    def process_message(message, user_id, conversation_state):
+        active.append(message)
+        overlaps.append(len(active))
+        time.sleep(0.05)
+        active.remove(message)
+        return {"message": "ok", "conversation_state": conversation_state}
+    
+    telegram_bot.message_handler = MagicMock()
+    telegram_bot.message_handler.process_message.side_effect = process_message
+    telegram_bot.database_client = MagicMock()
+    telegram_bot.database_client.get_conversation_state.return_value = {"user_id": "123456", "context": []}
+    
+    def make_update(text):
+        update = MagicMock()
+        update.message.text = text
+        update.message.reply_text = AsyncMock()
+        update.effective_user.id = 123456
+        return update
+    
+    await asyncio.gather(
+        telegram_bot._handle_message(make_update("first"), MagicMock()),
+        telegram_bot._handle_message(make_update("second"), MagicMock())
+    )
+    
+    assert telegram_bot.message_handler.process_message.call_count == 2
+    assert max(overlaps) == 1